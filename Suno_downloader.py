@@ -1,28 +1,69 @@
 #!/usr/bin/env python3
 import argparse
+import json
+import logging
+import os
 import random
 import re
 import sys
+import threading
 import time
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from io import BytesIO
 from pathlib import Path
 
-import requests
-from colorama import Fore, init
-from mutagen.id3 import ID3, APIC, TIT2, TPE1, error
-from mutagen.mp3 import MP3
+import httpx
+import orjson
+from colorama import Fore, Style, init
+
+_USE_COLOR = sys.stdout.isatty()
+if _USE_COLOR:
+    init()
+
+logger = logging.getLogger("suno")
+
+
+class ColoredFormatter(logging.Formatter):
+    """Add ANSI color once per record instead of per print call."""
+
+    LEVEL_COLORS = {logging.WARNING: Fore.YELLOW, logging.ERROR: Fore.RED}
+
+    def format(self, record):
+        msg = super().format(record)
+        color = getattr(record, "color", None) or self.LEVEL_COLORS.get(record.levelno)
+        if color and _USE_COLOR:
+            return f"{color}{msg}{Style.RESET_ALL}"
+        return msg
+
+
+def setup_logging(quiet=False):
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(ColoredFormatter("%(message)s"))
+    logger.addHandler(handler)
+    logger.setLevel(logging.WARNING if quiet else logging.INFO)
+
+
+# Convenience wrappers so call sites can keep their per-message colors.
+def _info(msg, color=None):
+    logger.info(msg, extra={"color": color} if color else None)
 
-init(autoreset=True)
 
-FILENAME_BAD_CHARS = r'[<>:"/\\|?*\x00-\x1F]'
 VERSIONED_NAME_RE = re.compile(r"^(.*) v(\d+)$")
 UNTITLED_PREFIX = "Untitled"
 LIKED_PREFIX = "(Liked) "
+FEED_BASE_URL = (
+    "https://studio-api.prod.suno.com/api/feed/v2"
+    "?hide_disliked=true&hide_gen_stems=true&hide_studio_clips=true&page="
+)
+
+# Characters not allowed in filenames, as a translate table: faster than
+# running the equivalent regex character class on every title.
+_SANITIZE_TABLE = str.maketrans({**{c: "_" for c in '<>:"/\\|?*'}, **{i: "_" for i in range(0x20)}})
 
 
 def sanitize_filename(name, maxlen=200):
-    safe = re.sub(FILENAME_BAD_CHARS, "_", name)
-    safe = safe.strip(" .")
+    safe = name.translate(_SANITIZE_TABLE).strip(" .")
     return safe[:maxlen] if len(safe) > maxlen else safe
 
 
@@ -38,32 +79,35 @@ def apply_liked_prefix(name, liked):
     return sanitize_filename(f"{LIKED_PREFIX}{name}")
 
 
-def clip_filename_base(clip):
+def build_names(clip):
+    """Compute (display_title, filename_base) for a clip in one pass."""
     raw_title = clip.get("title")
     title = raw_title.strip() if isinstance(raw_title, str) else ""
+    liked = clip_is_liked(clip)
     if title:
-        return apply_liked_prefix(sanitize_filename(title), clip_is_liked(clip))
+        return apply_liked_prefix(title, liked), apply_liked_prefix(sanitize_filename(title), liked)
 
     clip_id = clip.get("id") or "unknown"
     created_at = clip.get("created_at") or ""
     date_part = created_at[:10] if isinstance(created_at, str) and len(created_at) >= 10 else "unknown-date"
-    untitled = sanitize_filename(f"{UNTITLED_PREFIX} {date_part} {clip_id[:8]}")
-    return apply_liked_prefix(untitled, clip_is_liked(clip))
+    untitled = apply_liked_prefix(sanitize_filename(f"{UNTITLED_PREFIX} {date_part} {clip_id[:8]}"), liked)
+    return untitled, untitled
 
 
-def display_title(clip):
-    raw_title = clip.get("title")
-    title = raw_title.strip() if isinstance(raw_title, str) else ""
-    if title:
-        return apply_liked_prefix(title, clip_is_liked(clip))
-    return clip_filename_base(clip)
+def build_clients(proxies_list, concurrency):
+    # One HTTP/2 client per proxy (httpx binds the proxy at construction);
+    # a single multiplexed connection then serves all page fetches and
+    # concurrent downloads without per-request TLS handshakes.
+    limits = httpx.Limits(max_connections=max(32, concurrency), max_keepalive_connections=16)
+    if not proxies_list:
+        return [httpx.Client(http2=True, limits=limits)]
+    return [httpx.Client(http2=True, limits=limits, proxy=proxy) for proxy in proxies_list]
 
 
-def pick_proxy_dict(proxies_list):
-    if not proxies_list:
-        return None
-    proxy = random.choice(proxies_list)
-    return {"http": proxy, "https": proxy}
+def pick_client(clients):
+    if len(clients) == 1:
+        return clients[0]
+    return random.choice(clients)
 
 
 def reserve_unique_path(out_dir, base_name):
@@ -80,42 +124,89 @@ def reserve_unique_path(out_dir, base_name):
 
 def count_local_mp3_by_base(out_dir):
     counts = Counter()
-    for path in out_dir.glob("*.mp3"):
-        stem = path.stem
-        m = VERSIONED_NAME_RE.match(stem)
-        base = m.group(1) if m else stem
-        counts[base] += 1
+    match_versioned = VERSIONED_NAME_RE.match
+    # os.scandir avoids Path allocation and fnmatch per entry; the suffix
+    # check makes a per-entry is_file()/stat unnecessary.
+    with os.scandir(out_dir) as entries:
+        for entry in entries:
+            name = entry.name
+            if not name.endswith(".mp3"):
+                continue
+            stem = name[:-4]
+            m = match_versioned(stem)
+            base = m.group(1) if m else stem
+            counts[base] += 1
     return counts
 
 
-def embed_metadata(mp3_path, image_url=None, title=None, artist=None, proxies_list=None, token=None, timeout=15):
-    if not image_url:
-        return
+# Suno reuses cover art across versions of the same generation, so cache
+# fetched art by URL. Guarded by a lock for the download worker pool.
+_COVER_CACHE = {}
+_COVER_CACHE_LOCK = threading.Lock()
+_COVER_CACHE_MAX = 512
+
+
+def fetch_cover(image_url, token, clients, timeout):
+    with _COVER_CACHE_LOCK:
+        cached = _COVER_CACHE.get(image_url)
+    if cached is not None:
+        return cached
 
     headers = {"Authorization": f"Bearer {token}"} if token else {}
-    proxy_dict = pick_proxy_dict(proxies_list)
-    r = requests.get(image_url, proxies=proxy_dict, headers=headers, timeout=timeout)
+    r = pick_client(clients).get(image_url, headers=headers, timeout=timeout)
     r.raise_for_status()
-    image_bytes = r.content
     mime = r.headers.get("Content-Type", "image/jpeg").split(";")[0]
+    cover = (r.content, mime)
 
-    audio = MP3(mp3_path, ID3=ID3)
-    try:
-        audio.add_tags()
-    except error:
-        pass
+    with _COVER_CACHE_LOCK:
+        if len(_COVER_CACHE) >= _COVER_CACHE_MAX:
+            # Drop the oldest entry; insertion order is good enough here.
+            _COVER_CACHE.pop(next(iter(_COVER_CACHE)))
+        _COVER_CACHE[image_url] = cover
+    return cover
 
+
+def build_id3_block(title=None, artist=None, image_bytes=None, mime="image/jpeg"):
+    """Serialize an ID3v2.3 tag block in memory, ready to prepend to a download."""
+    # Deferred so runs without --with-thumbnail never pay the mutagen import.
+    from mutagen.id3 import ID3, APIC, TIT2, TPE1
+
+    tags = ID3()
     if title:
-        audio.tags["TIT2"] = TIT2(encoding=3, text=title)
+        tags["TIT2"] = TIT2(encoding=3, text=title)
     if artist:
-        audio.tags["TPE1"] = TPE1(encoding=3, text=artist)
+        tags["TPE1"] = TPE1(encoding=3, text=artist)
+    if image_bytes:
+        tags.add(APIC(encoding=3, mime=mime, type=3, desc="Cover", data=image_bytes))
+    buf = BytesIO()
+    tags.save(buf, v2_version=3, padding=lambda info: 4096)
+    return buf.getvalue()
+
+
+def load_feed_cache(path):
+    if not path.exists():
+        return None
+    try:
+        data = json.loads(path.read_text())
+        ids = data.get("ids")
+        max_created_at = data.get("max_created_at")
+        if not isinstance(ids, list) or not isinstance(max_created_at, str) or not max_created_at:
+            return None
+        return {"max_created_at": max_created_at, "ids": set(ids)}
+    except Exception:
+        return None
 
-    for key in list(audio.tags.keys()):
-        if key.startswith("APIC"):
-            del audio.tags[key]
 
-    audio.tags.add(APIC(encoding=3, mime=mime, type=3, desc="Cover", data=image_bytes))
-    audio.save(v2_version=3)
+def save_feed_cache(path, feed_cache, songs):
+    ids = set(feed_cache["ids"]) if feed_cache else set()
+    max_created_at = feed_cache["max_created_at"] if feed_cache else ""
+    for song in songs:
+        ids.add(song["id"])
+        if song["created_at"] > max_created_at:
+            max_created_at = song["created_at"]
+    if not max_created_at:
+        return
+    path.write_text(json.dumps({"max_created_at": max_created_at, "ids": sorted(ids)}))
 
 
 def load_token(arg_token, token_file):
@@ -147,114 +238,140 @@ class RetryExceeded(Exception):
         super().__init__(f"exceeded max retries on page {page}: {last_error}")
 
 
-def fetch_feed_page(session, page, token, proxies_list, timeout, max_retries, max_backoff, jitter, base_sleep):
-    url = (
-        "https://studio-api.prod.suno.com/api/feed/v2"
-        "?hide_disliked=true&hide_gen_stems=true&hide_studio_clips=true&page="
-        f"{page}"
-    )
-    headers = {"Authorization": f"Bearer {token}"}
+def backoff_wait(base_sleep, prev_wait, max_backoff):
+    # Decorrelated jitter: grows from the previous wait instead of a fixed
+    # 2**n ladder, so concurrent workers do not retry in lockstep.
+    return min(max_backoff, random.uniform(base_sleep, prev_wait * 3))
+
+
+def fetch_feed_page(clients, page, headers, timeout, max_retries, max_backoff, base_sleep):
+    url = FEED_BASE_URL + str(page)
+    # Rotate clients per request, not per attempt: retries stay on the same
+    # connection so keep-alive reuse is preserved.
+    client = pick_client(clients)
     attempt = 0
+    wait = base_sleep
     while True:
         attempt += 1
         try:
-            r = session.get(url, headers=headers, proxies=pick_proxy_dict(proxies_list), timeout=timeout)
+            r = client.get(url, headers=headers, timeout=timeout)
             if r.status_code in (401, 403):
                 raise AuthFailure(r.status_code)
             if r.status_code == 429 or 500 <= r.status_code < 600:
-                raise requests.HTTPError(f"retryable status {r.status_code}")
+                raise httpx.HTTPError(f"retryable status {r.status_code}")
             if 400 <= r.status_code < 500:
                 raise NonRetryableHTTP(page, r.status_code)
             r.raise_for_status()
-            data = r.json()
+            data = orjson.loads(r.content)
             batch = data if isinstance(data, list) else data.get("clips", [])
             return batch
-        except (requests.RequestException, ValueError) as e:
+        except (httpx.HTTPError, ValueError) as e:
             if max_retries and attempt > max_retries:
                 raise RetryExceeded(page, e) from e
-            wait = min(max_backoff, (2 ** (attempt - 1)) * base_sleep)
-            wait += random.uniform(0, jitter)
-            print(f"{Fore.YELLOW}Retrying page {page} in {wait:.1f}s (attempt {attempt}): {e}")
+            wait = backoff_wait(base_sleep, wait, max_backoff)
+            logger.warning(f"Retrying page {page} in {wait:.1f}s (attempt {attempt}): {e}")
             time.sleep(wait)
 
 
-def dedupe_clips_by_id(clips):
-    seen = set()
-    deduped = []
-    for clip in clips:
-        clip_id = clip.get("id")
-        if not clip_id:
-            continue
-        if clip_id in seen:
-            continue
-        seen.add(clip_id)
-        deduped.append(clip)
-    return deduped
-
-
-def fetch_all_clips(token, proxies_list, args):
-    print(f"{Fore.CYAN}Extracting private songs using Authorization Token...")
+def fetch_all_clips(token, clients, args, feed_cache=None):
+    _info("Extracting private songs using Authorization Token...", Fore.CYAN)
 
-    session = requests.Session()
+    auth_headers = {"Authorization": f"Bearer {token}"}
     clips = []
     page = 0
     complete = False
     stop_reason = ""
 
-    while True:
-        if args.max_pages and page >= args.max_pages:
-            stop_reason = f"max_pages:{args.max_pages}"
-            break
+    def fetch_page_task(page_num):
+        if page_num > 0 and args.sleep:
+            # Pacing gate between successive page requests, now inside the
+            # prefetch worker so it overlaps with clip processing.
+            time.sleep(args.sleep)
+        return fetch_feed_page(
+            clients=clients,
+            page=page_num,
+            headers=auth_headers,
+            timeout=args.timeout,
+            max_retries=args.max_retries,
+            max_backoff=args.max_backoff,
+            base_sleep=args.sleep,
+        )
 
-        print(f"{Fore.MAGENTA}Fetching songs (Page {page})...")
+    with ThreadPoolExecutor(max_workers=1) as prefetch_pool:
+        pending = None
         try:
-            batch = fetch_feed_page(
-                session=session,
-                page=page,
-                token=token,
-                proxies_list=proxies_list,
-                timeout=args.timeout,
-                max_retries=args.max_retries,
-                max_backoff=args.max_backoff,
-                jitter=args.jitter,
-                base_sleep=args.sleep,
-            )
-        except AuthFailure as e:
-            print(f"{Fore.RED}Authorization failed (status {e.status_code}). Token is likely expired/invalid.")
-            return [], False, f"auth_failed:{e.status_code}"
-        except NonRetryableHTTP as e:
-            print(f"{Fore.RED}{e}")
-            stop_reason = f"http_{e.status_code}_page:{e.page}"
-            break
-        except RetryExceeded as e:
-            print(f"{Fore.RED}{e}")
-            stop_reason = f"retry_exceeded_page:{e.page}"
-            break
-
-        if not batch:
-            print(f"{Fore.YELLOW}No more clips found on page {page}.")
-            complete = True
-            stop_reason = f"end_of_feed_page:{page}"
-            break
-
-        clips.extend(batch)
-        print(f"{Fore.GREEN}Found {len(batch)} clips on page {page}. Total so far: {len(clips)}")
-        page += 1
-        time.sleep(args.sleep)
-
-    deduped = dedupe_clips_by_id(clips)
+            while True:
+                if args.max_pages and page >= args.max_pages:
+                    stop_reason = f"max_pages:{args.max_pages}"
+                    break
+
+                _info(f"Fetching songs (Page {page})...", Fore.MAGENTA)
+                current = pending if pending is not None else prefetch_pool.submit(fetch_page_task, page)
+                # Keep exactly one page in flight ahead of processing.
+                next_page = page + 1
+                pending = None
+                if not (args.max_pages and next_page >= args.max_pages):
+                    pending = prefetch_pool.submit(fetch_page_task, next_page)
+
+                try:
+                    batch = current.result()
+                except AuthFailure as e:
+                    logger.error(f"Authorization failed (status {e.status_code}). Token is likely expired/invalid.")
+                    return [], False, f"auth_failed:{e.status_code}"
+                except NonRetryableHTTP as e:
+                    logger.error(str(e))
+                    stop_reason = f"http_{e.status_code}_page:{e.page}"
+                    break
+                except RetryExceeded as e:
+                    logger.error(str(e))
+                    stop_reason = f"retry_exceeded_page:{e.page}"
+                    break
+
+                if not batch:
+                    logger.warning(f"No more clips found on page {page}.")
+                    complete = True
+                    stop_reason = f"end_of_feed_page:{page}"
+                    break
+
+                clips.extend(batch)
+                _info(f"Found {len(batch)} clips on page {page}. Total so far: {len(clips)}", Fore.GREEN)
+
+                if feed_cache:
+                    # The feed is newest-first; once a page reaches clips older
+                    # than the cached high-water mark, everything further back
+                    # was seen on a previous run.
+                    batch_min = min((c.get("created_at") or "" for c in batch), default="")
+                    if batch_min and batch_min <= feed_cache["max_created_at"]:
+                        logger.warning(f"Page {page} reaches previously-seen clips; stopping incremental fetch.")
+                        complete = True
+                        stop_reason = f"cache_cutoff_page:{page}"
+                        break
+
+                page += 1
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+    # Dedup is fused into the song-building pass: one traversal instead of a
+    # dedupe walk followed by a rebuild.
+    cached_ids = feed_cache["ids"] if feed_cache else ()
+    seen = set()
     songs = []
-    for clip in deduped:
+    for clip in clips:
         clip_id = clip.get("id")
         audio_url = clip.get("audio_url")
         if not clip_id or not audio_url:
             continue
+        if clip_id in seen or clip_id in cached_ids:
+            continue
+        seen.add(clip_id)
+        display, base = build_names(clip)
         songs.append(
             {
                 "id": str(clip_id),
                 "title": clip.get("title") or "",
-                "display_title": display_title(clip),
-                "filename_base": clip_filename_base(clip),
+                "display_title": display,
+                "filename_base": base,
                 "audio_url": audio_url,
                 "image_url": clip.get("image_url"),
                 "display_name": clip.get("display_name"),
@@ -266,9 +383,11 @@ def fetch_all_clips(token, proxies_list, args):
     return songs, complete, stop_reason
 
 
-def plan_first_pass_downloads(songs, local_counts):
+def plan_first_pass_downloads(songs, local_counts, out_dir):
     seen_expected = Counter()
+    version_counts = Counter(local_counts)
     planned = []
+    reserved_paths = {}
     skipped_as_existing = 0
 
     for song in songs:
@@ -277,42 +396,55 @@ def plan_first_pass_downloads(songs, local_counts):
         if seen_expected[base] <= local_counts.get(base, 0):
             skipped_as_existing += 1
             continue
+        n = version_counts[base]
+        version_counts[base] = n + 1
+        reserved_paths[song["id"]] = out_dir / (f"{base}.mp3" if n == 0 else f"{base} v{n + 1}.mp3")
         planned.append(song)
 
-    return planned, skipped_as_existing
+    return planned, reserved_paths, skipped_as_existing
 
 
-def download_song(session, song, out_dir, token, proxies_list, args):
-    headers = {"Authorization": f"Bearer {token}"}
+def download_song(clients, song, out_path, token, args, id3_block=None):
+    # identity avoids the server gzipping already-compressed MP3 bodies.
+    headers = {"Authorization": f"Bearer {token}", "Accept-Encoding": "identity"}
+    client = pick_client(clients)
     attempt = 0
+    wait = args.sleep
     while True:
         attempt += 1
         tmp_path = None
         try:
-            with session.get(
+            with client.stream(
+                "GET",
                 song["audio_url"],
-                stream=True,
                 headers=headers,
-                proxies=pick_proxy_dict(proxies_list),
                 timeout=args.timeout,
             ) as r:
                 if r.status_code in (401, 403):
                     return {"ok": False, "fatal_auth": True, "error": f"auth_failed:{r.status_code}"}
                 if r.status_code == 429 or 500 <= r.status_code < 600:
-                    raise requests.HTTPError(f"retryable status {r.status_code}")
+                    raise httpx.HTTPError(f"retryable status {r.status_code}")
                 if 400 <= r.status_code < 500:
                     return {"ok": False, "fatal_auth": False, "error": f"http_{r.status_code}"}
                 r.raise_for_status()
 
-                out_path = reserve_unique_path(out_dir, song["filename_base"])
                 tmp_path = out_path.with_suffix(out_path.suffix + ".part")
                 with tmp_path.open("wb") as f:
-                    for chunk in r.iter_content(chunk_size=8192):
-                        if chunk:
-                            f.write(chunk)
+                    if id3_block:
+                        # Tag block goes in front of the audio data, fusing
+                        # metadata embedding into the same write pass.
+                        f.write(id3_block)
+                    # 1 MiB chunks keep Python-level iterations rare for
+                    # multi-MB MP3 bodies.
+                    for chunk in r.iter_raw(1024 * 1024):
+                        f.write(chunk)
+                if out_path.exists():
+                    # Pre-reserved path collided with a file written outside the
+                    # plan; fall back to stat-probing for the next free slot.
+                    out_path = reserve_unique_path(out_path.parent, song["filename_base"])
                 tmp_path.replace(out_path)
                 return {"ok": True, "path": out_path}
-        except (requests.RequestException, OSError) as e:
+        except (httpx.HTTPError, OSError) as e:
             if tmp_path and tmp_path.exists():
                 try:
                     tmp_path.unlink()
@@ -320,15 +452,15 @@ def download_song(session, song, out_dir, token, proxies_list, args):
                     pass
             if args.max_retries and attempt > args.max_retries:
                 return {"ok": False, "fatal_auth": False, "error": str(e)}
-            wait = min(args.max_backoff, (2 ** (attempt - 1)) * args.sleep)
-            wait += random.uniform(0, args.jitter)
-            print(f"{Fore.YELLOW}Retrying clip {song['id']} in {wait:.1f}s (attempt {attempt}): {e}")
+            wait = backoff_wait(args.sleep, wait, args.max_backoff)
+            logger.warning(f"Retrying clip {song['id']} in {wait:.1f}s (attempt {attempt}): {e}")
             time.sleep(wait)
 
 
-def main():
-    base_dir = Path(__file__).resolve().parent
+_BASE_DIR = Path(__file__).resolve().parent
 
+
+def build_parser():
     parser = argparse.ArgumentParser(
         description="First-pass bulk downloader for Suno (workflow step 1): fetch feed and download currently-missing files."
     )
@@ -336,106 +468,129 @@ def main():
     parser.add_argument(
         "--token-file",
         type=str,
-        default=str(base_dir / "token.txt"),
+        default=str(_BASE_DIR / "token.txt"),
         help="Path to token file used when --token is omitted.",
     )
     parser.add_argument(
         "--directory",
         type=str,
-        default=str(base_dir / "out"),
+        default=str(_BASE_DIR / "out"),
         help="Local directory for saving files (default: out).",
     )
     parser.add_argument("--proxy", type=str, help="Proxy with protocol (comma-separated).")
     parser.add_argument("--with-thumbnail", action="store_true", help="Embed each song thumbnail into ID3 metadata.")
-    parser.add_argument("--sleep", type=float, default=0.2, help="Base sleep/backoff unit in seconds.")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent download workers.")
+    parser.add_argument("--sleep", type=float, default=0.1, help="Base sleep/backoff unit in seconds.")
     parser.add_argument("--timeout", type=float, default=30.0, help="HTTP timeout in seconds.")
     parser.add_argument("--max-pages", type=int, default=0, help="Optional max pages to fetch (0 = no limit).")
     parser.add_argument("--max-retries", type=int, default=8, help="Retries per page/download (0 = infinite).")
     parser.add_argument("--max-backoff", type=float, default=60.0, help="Maximum backoff in seconds.")
-    parser.add_argument("--jitter", type=float, default=0.3, help="Random jitter added to backoff sleep.")
+    parser.add_argument("--refresh", action="store_true", help="Ignore the incremental feed cache and refetch all pages.")
     parser.add_argument("--dry-run", action="store_true", help="Build plan only; do not download files.")
     parser.add_argument("--fail-on-partial", action="store_true", help="Exit non-zero if API fetch did not complete.")
     parser.add_argument("--fail-on-download-errors", action="store_true", help="Exit non-zero if any downloads fail.")
-    args = parser.parse_args()
+    parser.add_argument("--quiet", action="store_true", help="Only log warnings and errors.")
+    return parser
+
+
+# Built once at import so repeated CLI/cron invocations skip re-declaring
+# every argument inside main().
+_PARSER = build_parser()
+
+
+def main():
+    args = _PARSER.parse_args()
+    setup_logging(quiet=args.quiet)
 
     token = load_token(args.token, args.token_file)
     if not token:
-        print(
-            f"{Fore.RED}No token provided. Pass --token or create token file at {args.token_file}",
-            file=sys.stderr,
-        )
+        logger.error(f"No token provided. Pass --token or create token file at {args.token_file}")
         sys.exit(1)
 
-    proxies_list = args.proxy.split(",") if args.proxy else None
+    concurrency = max(1, args.concurrency)
+    clients = build_clients(args.proxy.split(",") if args.proxy else None, concurrency)
     out_dir = Path(args.directory)
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    songs, complete_api_fetch, stop_reason = fetch_all_clips(token, proxies_list, args)
+    feed_cache_path = out_dir / ".suno_cache.json"
+    feed_cache = None if args.refresh else load_feed_cache(feed_cache_path)
+
+    songs, complete_api_fetch, stop_reason = fetch_all_clips(token, clients, args, feed_cache)
     if stop_reason.startswith("auth_failed"):
         sys.exit(1)
     if not songs:
-        print(f"{Fore.YELLOW}No clips discovered from API.")
+        logger.warning("No new clips discovered from API.")
         if args.fail_on_partial and not complete_api_fetch:
             sys.exit(2)
         sys.exit(0)
 
     local_counts = count_local_mp3_by_base(out_dir)
-    plan, skipped_as_existing = plan_first_pass_downloads(songs, local_counts)
+    plan, reserved_paths, skipped_as_existing = plan_first_pass_downloads(songs, local_counts, out_dir)
 
-    print(f"\n{Fore.CYAN}--- First-Pass Download Plan ---")
-    print(f"{Fore.CYAN}API unique clips: {len(songs)}")
-    print(f"{Fore.CYAN}Local files detected: {sum(local_counts.values())}")
-    print(f"{Fore.CYAN}Assumed already present by title count: {skipped_as_existing}")
-    print(f"{Fore.CYAN}Planned downloads: {len(plan)}")
-    print(f"{Fore.CYAN}API fetch complete: {complete_api_fetch} ({stop_reason})")
+    _info("\n--- First-Pass Download Plan ---", Fore.CYAN)
+    _info(f"API unique clips: {len(songs)}", Fore.CYAN)
+    _info(f"Local files detected: {sum(local_counts.values())}", Fore.CYAN)
+    _info(f"Assumed already present by title count: {skipped_as_existing}", Fore.CYAN)
+    _info(f"Planned downloads: {len(plan)}", Fore.CYAN)
+    _info(f"API fetch complete: {complete_api_fetch} ({stop_reason})", Fore.CYAN)
 
     if args.dry_run:
         for song in plan[:25]:
-            print(f"{Fore.YELLOW}DRY RUN: {song['display_title']} -> {song['filename_base']}.mp3")
+            logger.warning(f"DRY RUN: {song['display_title']} -> {song['filename_base']}.mp3")
         if len(plan) > 25:
-            print(f"{Fore.YELLOW}... and {len(plan) - 25} more")
+            logger.warning(f"... and {len(plan) - 25} more")
         sys.exit(0)
 
-    session = requests.Session()
     downloaded = 0
     failed = 0
+    failed_ids = set()
     fatal_auth = False
 
-    print(f"\n{Fore.CYAN}--- Starting Download Process ({len(plan)} planned) ---")
-    for song in plan:
-        print(f"Processing: {Fore.GREEN}{song['display_title']}")
-        result = download_song(session, song, out_dir, token, proxies_list, args)
-        if not result.get("ok"):
-            failed += 1
-            if result.get("fatal_auth"):
-                fatal_auth = True
-            print(f"{Fore.RED}  -> Failed: {result.get('error')}")
-            continue
-
-        downloaded += 1
-        saved_path = result["path"]
-        print(f"{Fore.GREEN}  -> Downloaded: {saved_path.name}")
-
+    def process_song(song):
+        _info(f"Processing: {song['display_title']}", Fore.GREEN)
+        id3_block = None
         if args.with_thumbnail and song.get("image_url"):
             try:
-                embed_metadata(
-                    saved_path,
-                    image_url=song["image_url"],
-                    token=token,
-                    artist=song.get("display_name"),
+                image_bytes, mime = fetch_cover(song["image_url"], token, clients, args.timeout)
+                id3_block = build_id3_block(
                     title=song.get("title") or song["filename_base"],
-                    proxies_list=proxies_list,
-                    timeout=args.timeout,
+                    artist=song.get("display_name"),
+                    image_bytes=image_bytes,
+                    mime=mime,
                 )
-                print(f"{Fore.GREEN}  -> Embedded thumbnail")
             except Exception as e:
-                print(f"{Fore.YELLOW}  -> Thumbnail embed skipped: {e}")
-
-    print(f"\n{Fore.BLUE}--- Summary ---")
-    print(f"{Fore.BLUE}Downloaded: {downloaded}")
-    print(f"{Fore.BLUE}Failed: {failed}")
-    print(f"{Fore.BLUE}Output directory: {out_dir}")
-    print(f"{Fore.BLUE}API fetch complete: {complete_api_fetch} ({stop_reason})")
+                logger.warning(f"  -> Thumbnail embed skipped ({song['display_title']}): {e}")
+        return song, download_song(clients, song, reserved_paths[song["id"]], token, args, id3_block=id3_block)
+
+    _info(f"\n--- Starting Download Process ({len(plan)} planned, {concurrency} workers) ---", Fore.CYAN)
+    with ThreadPoolExecutor(max_workers=concurrency) as download_pool:
+        for future in as_completed([download_pool.submit(process_song, song) for song in plan]):
+            song, result = future.result()
+            if not result.get("ok"):
+                failed += 1
+                failed_ids.add(song["id"])
+                if result.get("fatal_auth"):
+                    fatal_auth = True
+                logger.error(f"  -> Failed: {song['display_title']}: {result.get('error')}")
+                continue
+
+            downloaded += 1
+            saved_path = result["path"]
+            _info(f"  -> Downloaded: {saved_path.name}", Fore.GREEN)
+
+    # Persist the feed cache only after a complete fetch and a finished
+    # download pass: a partial fetch must not advance the high-water mark
+    # past pages that were never reached, and failed songs stay out of the
+    # cache so the next run can retry the ones still above the watermark.
+    # Failed songs that end up below it are left to targeted_update.
+    if complete_api_fetch:
+        save_feed_cache(feed_cache_path, feed_cache, [s for s in songs if s["id"] not in failed_ids])
+
+    _info("\n--- Summary ---", Fore.BLUE)
+    _info(f"Downloaded: {downloaded}", Fore.BLUE)
+    _info(f"Failed: {failed}", Fore.BLUE)
+    _info(f"Output directory: {out_dir}", Fore.BLUE)
+    _info(f"API fetch complete: {complete_api_fetch} ({stop_reason})", Fore.BLUE)
 
     if fatal_auth:
         sys.exit(1)
@@ -1,24 +1,30 @@
 #!/usr/bin/env python3
 import argparse
-import json
+import asyncio
+import os
 import random
-import re
 import time
 from collections import Counter
-from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from pathlib import Path
 
-import requests
+import httpx
+import ijson
+import orjson
 
-FILENAME_BAD_CHARS = r'[<>:"/\\|?*\x00-\x1F]'
+# Single translate table replaces bad chars in one C-level pass; clean
+# titles (the common case) pay no regex machinery at all.
+_SANITIZE_TABLE = str.maketrans({**{c: "_" for c in '<>:"/\\|?*'}, **{i: "_" for i in range(0x20)}})
 UNTITLED_PREFIX = "Untitled"
 LIKED_PREFIX = "(Liked) "
 CACHE_PAGE_SIZE = 20
+# How many live pages to keep in flight ahead of the consumer.
+PREFETCH_WINDOW = 5
 
 
 def sanitize_filename(name, maxlen=200):
-    safe = re.sub(FILENAME_BAD_CHARS, "_", name)
-    safe = safe.strip(" .")
+    safe = name.translate(_SANITIZE_TABLE).strip(" .")
     return safe[:maxlen] if len(safe) > maxlen else safe
 
 
@@ -34,8 +40,17 @@ def apply_liked_prefix(name, liked):
     return sanitize_filename(f"{LIKED_PREFIX}{name}")
 
 
+_TS_CACHE = (None, "")
+
+
 def utc_ts():
-    return datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
+    # strftime shows up in profiles under heavy retry logging; reformat only
+    # when the integer second changes.
+    global _TS_CACHE
+    now = int(time.time())
+    if _TS_CACHE[0] != now:
+        _TS_CACHE = (now, time.strftime("%Y-%m-%d %H:%M:%S UTC", time.gmtime(now)))
+    return _TS_CACHE[1]
 
 
 def is_dns_error(err):
@@ -82,67 +97,212 @@ def clip_id(clip):
 
 
 def dedupe_clips_by_id(clips):
-    seen_ids = set()
-    deduped = []
+    # Insertion-ordered dict: one lookup per clip, first occurrence wins.
+    # Clips without an id are all kept, keyed by object identity.
+    deduped = {}
     for clip in clips:
         cid = clip_id(clip)
-        if cid and cid in seen_ids:
+        deduped.setdefault(cid if cid else id(clip), clip)
+    return list(deduped.values())
+
+
+def _read_cached_batch(cache_file):
+    try:
+        data = orjson.loads(cache_file.read_bytes())
+    except Exception:
+        return None
+    batch = data if isinstance(data, list) else data.get("clips", [])
+    return batch if isinstance(batch, list) else None
+
+
+def list_cache_pages(cache_dir):
+    # scandir reads names without a stat per entry, and the zero-padded page
+    # numbers make a plain name sort numeric order too.
+    with os.scandir(cache_dir) as entries:
+        names = [e.name for e in entries if e.name.startswith("page_") and e.name.endswith(".json")]
+    names.sort()
+    return [cache_dir / name for name in names]
+
+
+def load_head_clips(cache_dir):
+    head_file = cache_dir / "head.json"
+    if not head_file.exists():
+        return []
+    return _read_cached_batch(head_file) or []
+
+
+def _normalize_cache_line(raw):
+    """Make a fetched page body safe as one ndjson line.
+
+    Bare-list responses are wrapped into the {"clips": ...} shape and
+    insignificant newlines collapsed, so every line parses on its own.
+    """
+    if raw.lstrip()[:1] == b"[":
+        raw = b'{"clips":' + raw + b"}"
+    if b"\n" in raw or b"\r" in raw:
+        raw = raw.replace(b"\r", b" ").replace(b"\n", b" ")
+    return raw
+
+
+def read_cache_batches(cache_dir):
+    """Parse cache.ndjson into a list of page batches.
+
+    Also returns the byte length of the valid prefix so a torn tail from an
+    interrupted run can be truncated before new pages are appended.
+    """
+    cache_file = cache_dir / "cache.ndjson"
+    batches = []
+    valid = 0
+    if not cache_file.exists():
+        return batches, valid
+    with cache_file.open("rb") as f:
+        for line in f:
+            stripped = line.strip()
+            if stripped:
+                try:
+                    data = orjson.loads(stripped)
+                except Exception:
+                    break
+                batch = data if isinstance(data, list) else data.get("clips", [])
+                if not isinstance(batch, list):
+                    break
+                batches.append(batch)
+            valid += len(line)
+    return batches, valid
+
+
+def migrate_legacy_pages(cache_dir, log):
+    """One-time conversion of per-page page_*.json files into cache.ndjson."""
+    cache_file = cache_dir / "cache.ndjson"
+    legacy_pages = list_cache_pages(cache_dir)
+    if cache_file.exists() or not legacy_pages:
+        return
+    # Read + parse the legacy pages in parallel; writes stay in page order.
+    with ThreadPoolExecutor(max_workers=min(8, len(legacy_pages))) as pool:
+        page_batches = list(pool.map(_read_cached_batch, legacy_pages))
+    lines = []
+    for batch in page_batches:
+        if batch is None:
             continue
-        if cid:
-            seen_ids.add(cid)
-        deduped.append(clip)
-    return deduped
+        lines.append(orjson.dumps({"clips": batch}))
+        if not batch:
+            break
+    cache_file.write_bytes(b"\n".join(lines) + (b"\n" if lines else b""))
+    for old in legacy_pages:
+        old.unlink()
+    log(f"Migrated {len(lines)} legacy cache page(s) into cache.ndjson")
 
 
 def load_cached_clips(cache_dir):
-    clips = []
-    for cache_file in sorted(cache_dir.glob("page_*.json")):
-        try:
-            data = json.loads(cache_file.read_text())
-        except Exception:
-            continue
-        batch = data if isinstance(data, list) else data.get("clips", [])
-        if not isinstance(batch, list):
-            continue
+    clips = list(load_head_clips(cache_dir))
+    batches, _ = read_cache_batches(cache_dir)
+    if not batches:
+        # Legacy per-page layout, still present until migration has run.
+        for batch in map(_read_cached_batch, list_cache_pages(cache_dir)):
+            if batch is None:
+                continue
+            if not batch:
+                break
+            clips.extend(batch)
+        return dedupe_clips_by_id(clips)
+    for batch in batches:
         if not batch:
             break
         clips.extend(batch)
     return dedupe_clips_by_id(clips)
 
 
-def rewrite_cache_clips(cache_dir, clips):
-    for old in cache_dir.glob("page_*.json"):
-        old.unlink()
+def write_ids_index(cache_dir, ids):
+    (cache_dir / "ids.idx").write_text("".join(i + "\n" for i in ids), encoding="utf-8")
+
 
-    if not clips:
-        (cache_dir / "page_0000.json").write_text(json.dumps({"clips": []}))
+def append_ids_index(cache_dir, ids):
+    if not ids:
         return
+    with (cache_dir / "ids.idx").open("a", encoding="utf-8") as f:
+        f.write("".join(i + "\n" for i in ids))
+
+
+def _scan_page_ids(cache_file):
+    """Stream only clip ids out of a cache page, skipping the full DOM load."""
+    with cache_file.open("rb") as f:
+        head = f.read(1)
+        while head and head.isspace():
+            head = f.read(1)
+        f.seek(0)
+        prefix = "item.id" if head == b"[" else "clips.item.id"
+        return [str(cid) for cid in ijson.items(f, prefix) if cid]
+
+
+def load_cached_ids(cache_dir):
+    """Return the set of cached clip ids, from the ids.idx sidecar if present.
+
+    The sidecar avoids touching the cache pages at all; when it is missing
+    the ids are streamed out of the pages with ijson, which never builds
+    the per-clip dicts this callsite would throw away.
+    """
+    idx_file = cache_dir / "ids.idx"
+    if idx_file.exists():
+        # bytes.split avoids decoding the whole index; ids are plain ASCII
+        return {cid.decode("ascii", "replace") for cid in idx_file.read_bytes().split()}
+    ids = set()
+    cache_file = cache_dir / "cache.ndjson"
+    if cache_file.exists():
+        try:
+            with cache_file.open("rb") as f:
+                ids.update(str(cid) for cid in ijson.items(f, "clips.item.id", multiple_values=True) if cid)
+        except Exception:
+            pass
+    for cache_file in chain([cache_dir / "head.json"], list_cache_pages(cache_dir)):
+        if not cache_file.exists():
+            continue
+        try:
+            ids.update(_scan_page_ids(cache_file))
+        except Exception:
+            continue
+    if ids:
+        write_ids_index(cache_dir, ids)
+    return ids
 
-    page = 0
-    for i in range(0, len(clips), CACHE_PAGE_SIZE):
-        chunk = clips[i:i + CACHE_PAGE_SIZE]
-        (cache_dir / f"page_{page:04d}.json").write_text(json.dumps({"clips": chunk}))
-        page += 1
 
-    (cache_dir / f"page_{page:04d}.json").write_text(json.dumps({"clips": []}))
+def rewrite_cache_clips(cache_dir, clips):
+    head_file = cache_dir / "head.json"
+    if head_file.exists():
+        head_file.unlink()
+    for old in list_cache_pages(cache_dir):
+        old.unlink()
+    ids = [cid for cid in (clip_id(c) for c in clips) if cid]
+    write_ids_index(cache_dir, ids)
+
+    # One ndjson line per 20-clip batch plus an empty end sentinel; a single
+    # write replaces the per-page open/write/close storm.
+    lines = [
+        orjson.dumps({"clips": clips[i:i + CACHE_PAGE_SIZE]})
+        for i in range(0, len(clips), CACHE_PAGE_SIZE)
+    ]
+    lines.append(orjson.dumps({"clips": []}))
+    (cache_dir / "cache.ndjson").write_bytes(b"\n".join(lines) + b"\n")
 
 
-def fetch_live_page(session, base_api_url, headers, page, args, log):
+async def fetch_live_page(client, base_api_url, headers, page, args, log):
     attempt = 0
     while True:
         try:
-            r = session.get(base_api_url + str(page), headers=headers, timeout=args.timeout)
+            r = await client.get(base_api_url + str(page), headers=headers, timeout=args.timeout)
             if r.status_code in (401, 403):
                 raise AuthFailure(r.status_code)
             if r.status_code == 429 or 500 <= r.status_code < 600:
-                raise requests.HTTPError(f"retryable status {r.status_code}")
+                raise httpx.HTTPStatusError(
+                    f"retryable status {r.status_code}", request=r.request, response=r
+                )
             if 400 <= r.status_code < 500:
                 raise NonRetryableHTTP(page, r.status_code)
             r.raise_for_status()
-            data = r.json()
+            raw = r.content
+            data = orjson.loads(raw)
             batch = data if isinstance(data, list) else data.get("clips", [])
-            return data, batch
-        except (requests.RequestException, ValueError) as e:
+            return batch, raw
+        except (httpx.HTTPError, ValueError) as e:
             attempt += 1
             if args.max_retries and attempt > args.max_retries:
                 raise RetryExceeded(page, e) from e
@@ -151,23 +311,29 @@ def fetch_live_page(session, base_api_url, headers, page, args, log):
             backoff = min(args.max_backoff, (2 ** (attempt - 1)) * args.sleep)
             backoff += random.uniform(0, args.jitter)
             log(f"Retrying page {page} in {backoff:.1f}s (attempt {attempt}): {e}")
-            time.sleep(backoff)
+            await asyncio.sleep(backoff)
 
 
-def sync_cache_head(session, base_api_url, headers, cache_dir, args, log):
-    cached_clips = load_cached_clips(cache_dir)
-    if not cached_clips:
+async def sync_cache_head(client, base_api_url, headers, cache_dir, args, log):
+    cached_ids = load_cached_ids(cache_dir)
+    if not cached_ids:
         return {"status": "empty_cache", "shifted_clips": 0}
 
-    cached_ids = {clip_id(c) for c in cached_clips if clip_id(c)}
     live_prefix = []
     anchor_found = False
 
-    for page in range(0, args.head_sync_pages):
-        _, batch = fetch_live_page(session, base_api_url, headers, page, args, log)
+    # Probe all head pages at once; HTTP/2 multiplexes them onto one connection.
+    results = await asyncio.gather(
+        *(
+            fetch_live_page(client, base_api_url, headers, page, args, log)
+            for page in range(0, args.head_sync_pages)
+        )
+    )
+
+    for batch, _ in results:
         if not batch:
             rewrite_cache_clips(cache_dir, [])
-            return {"status": "feed_empty", "shifted_clips": len(cached_clips)}
+            return {"status": "feed_empty", "shifted_clips": len(cached_ids)}
 
         for clip in batch:
             cid = clip_id(clip)
@@ -181,14 +347,115 @@ def sync_cache_head(session, base_api_url, headers, cache_dir, args, log):
     if not anchor_found:
         return {"status": "no_overlap_refresh", "shifted_clips": 0}
 
-    merged = dedupe_clips_by_id(live_prefix + cached_clips)
-    shifted_clips = max(0, len(merged) - len(cached_clips))
+    # Prepend only the new clips to the head overflow file instead of
+    # renumbering every page_*.json just to insert a few at the front.
+    old_head = load_head_clips(cache_dir)
+    new_head = dedupe_clips_by_id(live_prefix + old_head)
+    shifted_clips = len(new_head) - len(old_head)
     if shifted_clips > 0:
-        rewrite_cache_clips(cache_dir, merged)
+        (cache_dir / "head.json").write_bytes(orjson.dumps({"clips": new_head}))
+        append_ids_index(cache_dir, sorted({clip_id(c) for c in live_prefix if clip_id(c)} - cached_ids))
         return {"status": "shifted", "shifted_clips": shifted_clips}
     return {"status": "up_to_date", "shifted_clips": 0}
 
 
+async def collect_clips(client, base_api_url, headers, cache_dir, args, log):
+    """Replay cached pages, then fetch the rest live with a prefetch window.
+
+    Returns (clips, complete, stop_reason, last_page_reached).
+    """
+    page = 0
+    # Collect per-page batches and flatten once at the end; repeated
+    # clips.extend across hundreds of pages reallocates the list O(log N)
+    # times.
+    batches = []
+    total = 0
+
+    def flatten():
+        return list(chain.from_iterable(batches))
+
+    # Phase 1: replay cached pages until a miss (skipped entirely on --refresh).
+    if not args.refresh:
+        head = load_head_clips(cache_dir)
+        if head:
+            batches.append(head)
+            total += len(head)
+            log(f"Loaded {len(head)} clip(s) from cache head overflow (total {total})")
+    cache_file = cache_dir / "cache.ndjson"
+    if args.refresh:
+        for name in ("head.json", "ids.idx", "cache.ndjson"):
+            stale = cache_dir / name
+            if stale.exists():
+                stale.unlink()
+    else:
+        cached_batches, valid_len = read_cache_batches(cache_dir)
+        for batch in cached_batches:
+            if args.max_pages and page >= args.max_pages:
+                log(f"Reached max-pages limit: {args.max_pages}")
+                return flatten(), False, f"max_pages_reached:{args.max_pages}", page
+            if not batch:
+                log(f"No more clips at page {page}.")
+                return flatten(), True, f"end_of_feed_page:{page}", page
+            batches.append(batch)
+            total += len(batch)
+            log(f"Loaded page {page} from cache: {len(batch)} clips (total {total})")
+            page += 1
+        if cache_file.exists() and valid_len < cache_file.stat().st_size:
+            # Drop a torn tail from an interrupted run before appending.
+            log(f"WARN: truncating corrupt cache tail after page {page}. Refetching...")
+            with cache_file.open("r+b") as f:
+                f.truncate(valid_len)
+
+    # Phase 2: live fetch. Keep up to PREFETCH_WINDOW pages in flight so each
+    # consumed page has already been downloading while earlier ones processed.
+    tasks = {}
+    cache_out = cache_file.open("ab")
+    try:
+        while True:
+            if args.max_pages and page >= args.max_pages:
+                log(f"Reached max-pages limit: {args.max_pages}")
+                return flatten(), False, f"max_pages_reached:{args.max_pages}", page
+
+            for p in range(page, page + PREFETCH_WINDOW):
+                if p not in tasks and not (args.max_pages and p >= args.max_pages):
+                    tasks[p] = asyncio.ensure_future(
+                        fetch_live_page(client, base_api_url, headers, p, args, log)
+                    )
+
+            try:
+                batch, raw = await tasks.pop(page)
+            except AuthFailure as e:
+                log(f"ERROR: auth failed with status {e.status_code}")
+                return flatten(), False, f"auth_failed:{e.status_code}", page
+            except NonRetryableHTTP as e:
+                log(f"ERROR: non-retryable HTTP status {e.status_code} on page {e.page}")
+                return flatten(), False, f"http_{e.status_code}_page:{e.page}", page
+            except RetryExceeded as e:
+                log(f"ERROR: exceeded max retries on page {e.page}: {e.last_error}")
+                return flatten(), False, f"max_retries_exceeded_page:{e.page}", page
+
+            # The response body is already valid JSON; append it verbatim as
+            # one ndjson line rather than re-serializing the parsed object.
+            cache_out.write(_normalize_cache_line(raw) + b"\n")
+            cache_out.flush()
+            append_ids_index(cache_dir, [cid for cid in (clip_id(c) for c in batch) if cid])
+
+            if not batch:
+                log(f"No more clips at page {page}.")
+                return flatten(), True, f"end_of_feed_page:{page}", page
+
+            batches.append(batch)
+            total += len(batch)
+            log(f"Fetched page {page}: {len(batch)} clips (total {total})")
+            page += 1
+            if args.sleep:
+                await asyncio.sleep(args.sleep)
+    finally:
+        cache_out.close()
+        for task in tasks.values():
+            task.cancel()
+
+
 def main():
     base_dir = Path(__file__).resolve().parent
 
@@ -226,11 +493,14 @@ def main():
     cache_dir.mkdir(parents=True, exist_ok=True)
 
     log_path = out_dir / "progress_check.log"
+    # One handle for the whole run; per-message open/close was three syscalls
+    # per line inside the fetch loop. Flush keeps tail -f usable.
+    log_file = log_path.open("a", encoding="utf-8")
 
     def log(msg):
         line = f"[{utc_ts()}] {msg}"
-        with log_path.open("a", encoding="utf-8") as f:
-            f.write(line + "\n")
+        log_file.write(line + "\n")
+        log_file.flush()
         print(line)
 
     token = args.token
@@ -239,7 +509,7 @@ def main():
         if not token_file.exists():
             log(f"ERROR: token file not found at {token_file}")
             raise SystemExit(1)
-        token = token_file.read_text().strip()
+        token = token_file.read_bytes().decode("utf-8").strip()
 
     base_api_url = (
         "https://studio-api.prod.suno.com/api/feed/v2"
@@ -247,147 +517,94 @@ def main():
     )
     headers = {"Authorization": f"Bearer {token}"}
 
-    session = requests.Session()
+    migrate_legacy_pages(cache_dir, log)
 
     log("Starting API fetch...")
 
     cache_head_sync = "disabled_by_flag" if args.head_sync_pages <= 0 else "skipped"
     cache_head_shifted_clips = 0
 
-    if not args.refresh and args.head_sync_pages > 0 and any(cache_dir.glob("page_*.json")):
-        try:
-            sync_result = sync_cache_head(session, base_api_url, headers, cache_dir, args, log)
-            cache_head_sync = sync_result["status"]
-            cache_head_shifted_clips = sync_result.get("shifted_clips", 0)
-            if cache_head_sync == "shifted":
-                log(f"Cache head sync inserted {cache_head_shifted_clips} new clip(s) at the front.")
-            if cache_head_sync == "no_overlap_refresh":
-                log(
-                    f"No cache overlap found in first {args.head_sync_pages} live pages; "
-                    "falling back to full refresh."
-                )
-                for old in cache_dir.glob("page_*.json"):
-                    old.unlink()
-                args.refresh = True
-        except AuthFailure as e:
-            log(f"ERROR: auth failed with status {e.status_code}")
-            raise SystemExit(1)
-        except NonRetryableHTTP as e:
-            log(f"ERROR: non-retryable HTTP status {e.status_code} on page {e.page} during head sync")
-            raise SystemExit(1)
-        except RetryExceeded as e:
-            log(f"ERROR: exceeded max retries on page {e.page} during head sync: {e.last_error}")
-            raise SystemExit(1)
-    elif args.refresh:
-        cache_head_sync = "skipped_refresh_mode"
-
-    page = 0
-    clips = []
-    complete = True
-    stop_reason = "end_of_feed"
-
-    while True:
-        if args.max_pages and page >= args.max_pages:
-            log(f"Reached max-pages limit: {args.max_pages}")
-            complete = False
-            stop_reason = f"max_pages_reached:{args.max_pages}"
-            break
-
-        cache_file = cache_dir / f"page_{page:04d}.json"
-
-        if cache_file.exists() and not args.refresh:
-            try:
-                data = json.loads(cache_file.read_text())
-                batch = data if isinstance(data, list) else data.get("clips", [])
-                if not batch:
-                    log(f"No more clips at page {page}.")
-                    stop_reason = f"end_of_feed_page:{page}"
-                    break
-                clips.extend(batch)
-                log(f"Loaded page {page} from cache: {len(batch)} clips (total {len(clips)})")
-                page += 1
-                time.sleep(args.sleep)
-                continue
-            except Exception as e:
-                log(f"WARN: failed to read cache for page {page}: {e}. Refetching...")
-
-        batch = None
-        while True:
-            try:
-                data, batch = fetch_live_page(session, base_api_url, headers, page, args, log)
-                cache_file.write_text(json.dumps(data))
-
-                if not batch:
-                    log(f"No more clips at page {page}.")
-                    stop_reason = f"end_of_feed_page:{page}"
-                    break
-
-                clips.extend(batch)
-                log(f"Fetched page {page}: {len(batch)} clips (total {len(clips)})")
-                page += 1
-                time.sleep(args.sleep)
-                break
-            except AuthFailure as e:
-                log(f"ERROR: auth failed with status {e.status_code}")
-                complete = False
-                stop_reason = f"auth_failed:{e.status_code}"
-                break
-            except NonRetryableHTTP as e:
-                log(f"ERROR: non-retryable HTTP status {e.status_code} on page {e.page}")
-                complete = False
-                stop_reason = f"http_{e.status_code}_page:{e.page}"
-                break
-            except RetryExceeded as e:
-                log(f"ERROR: exceeded max retries on page {e.page}: {e.last_error}")
-                complete = False
-                stop_reason = f"max_retries_exceeded_page:{e.page}"
-                break
-
-        # end while for attempts
-
-        if batch == []:
-            break
-        if stop_reason.startswith("auth_failed") or stop_reason.startswith("http_") or stop_reason.startswith("max_retries_exceeded"):
-            break
+    async def run_fetch():
+        nonlocal cache_head_sync, cache_head_shifted_clips
+        # Pool sizing and connect-level retries live on the transport, so
+        # transient connection failures never reach the page retry loop.
+        transport = httpx.AsyncHTTPTransport(
+            http2=True,
+            retries=3,
+            limits=httpx.Limits(max_connections=10, max_keepalive_connections=10),
+        )
+        async with httpx.AsyncClient(transport=transport) as client:
+            if not args.refresh and args.head_sync_pages > 0 and (cache_dir / "cache.ndjson").exists():
+                try:
+                    sync_result = await sync_cache_head(client, base_api_url, headers, cache_dir, args, log)
+                    cache_head_sync = sync_result["status"]
+                    cache_head_shifted_clips = sync_result.get("shifted_clips", 0)
+                    if cache_head_sync == "shifted":
+                        log(f"Cache head sync inserted {cache_head_shifted_clips} new clip(s) at the front.")
+                    if cache_head_sync == "no_overlap_refresh":
+                        log(
+                            f"No cache overlap found in first {args.head_sync_pages} live pages; "
+                            "falling back to full refresh."
+                        )
+                        for name in ("head.json", "ids.idx", "cache.ndjson"):
+                            stale = cache_dir / name
+                            if stale.exists():
+                                stale.unlink()
+                        args.refresh = True
+                except AuthFailure as e:
+                    log(f"ERROR: auth failed with status {e.status_code}")
+                    raise SystemExit(1)
+                except NonRetryableHTTP as e:
+                    log(f"ERROR: non-retryable HTTP status {e.status_code} on page {e.page} during head sync")
+                    raise SystemExit(1)
+                except RetryExceeded as e:
+                    log(f"ERROR: exceeded max retries on page {e.page} during head sync: {e.last_error}")
+                    raise SystemExit(1)
+            elif args.refresh:
+                cache_head_sync = "skipped_refresh_mode"
+
+            return await collect_clips(client, base_api_url, headers, cache_dir, args, log)
+
+    clips, complete, stop_reason, page = asyncio.run(run_fetch())
 
     # summarize expected; dedupe by clip id because feed can contain repeats
-    deduped_clips = []
-    seen_ids = set()
-    for c in clips:
-        clip_id = c.get("id")
-        if clip_id and clip_id in seen_ids:
-            continue
-        if clip_id:
-            seen_ids.add(clip_id)
-        deduped_clips.append(c)
+    deduped_clips = dedupe_clips_by_id(clips)
 
     expected = Counter()
     for c in deduped_clips:
         base = clip_base_name(c)
         expected[base] += 1
 
-    # actual counts by base filename (strip ' vN' suffix)
+    # actual counts by base filename (strip ' vN' suffix); os.scandir avoids a
+    # stat per entry and the suffix check is a string split, not a regex
     actual = Counter()
-    for p in out_dir.glob("*.mp3"):
-        stem = p.stem
-        m = re.match(r"^(.*) v(\d+)$", stem)
-        base = m.group(1) if m else stem
-        actual[base] += 1
+    with os.scandir(out_dir) as entries:
+        for entry in entries:
+            name = entry.name
+            if not name.endswith(".mp3"):
+                continue
+            stem = name[:-4]
+            head, sep, tail = stem.rpartition(" v")
+            base = head if sep and tail.isdigit() else stem
+            actual[base] += 1
 
-    missing = {base: (need, actual.get(base, 0)) for base, need in expected.items() if actual.get(base, 0) < need}
-    extra = {base: (actual.get(base, 0), expected.get(base, 0)) for base in actual.keys() if actual.get(base, 0) > expected.get(base, 0)}
+    # Counter subtraction does the full-key-space pass in C; only the
+    # deviating titles are touched from Python afterwards.
+    missing = {base: (expected[base], actual[base]) for base in +(expected - actual)}
+    extra = {base: (actual[base], expected[base]) for base in +(actual - expected)}
 
     missing_path = out_dir / "progress_missing.txt"
     extra_path = out_dir / "progress_extra.txt"
     summary_path = out_dir / "progress_summary.json"
 
-    with missing_path.open("w", encoding="utf-8") as f:
-        for base, (need, have) in sorted(missing.items()):
-            f.write(f"{base}\tneed={need}\thave={have}\n")
-
-    with extra_path.open("w", encoding="utf-8") as f:
-        for base, (have, need) in sorted(extra.items()):
-            f.write(f"{base}\thave={have}\texpected={need}\n")
+    missing_path.write_text(
+        "".join(f"{base}\tneed={need}\thave={have}\n" for base, (need, have) in sorted(missing.items())),
+        encoding="utf-8",
+    )
+    extra_path.write_text(
+        "".join(f"{base}\thave={have}\texpected={need}\n" for base, (have, need) in sorted(extra.items())),
+        encoding="utf-8",
+    )
 
     summary = {
         "api_clips_raw": len(clips),
@@ -408,10 +625,11 @@ def main():
         "cache_head_shifted_clips": cache_head_shifted_clips,
         "cache_head_pages_checked": args.head_sync_pages,
     }
-    summary_path.write_text(json.dumps(summary, indent=2))
+    summary_path.write_bytes(orjson.dumps(summary, option=orjson.OPT_INDENT_2))
 
     log("--- Summary ---")
-    log(json.dumps(summary))
+    log(orjson.dumps(summary).decode())
+    log_file.close()
     if args.fail_on_partial and not complete:
         raise SystemExit(2)
 
@@ -1,25 +1,36 @@
 #!/usr/bin/env python3
 import argparse
-import json
+import asyncio
+import heapq
+import logging
+import os
 import random
-import re
+import shutil
+import sys
 import time
-from collections import Counter, defaultdict
+from collections import Counter
 from datetime import datetime, timezone
+from operator import itemgetter
 from pathlib import Path
 
-import requests
+import aiohttp
+import orjson
+import xxhash
 
-FILENAME_BAD_CHARS = r'[<>:"/\\|?*\x00-\x1F]'
-VERSIONED_NAME_RE = re.compile(r"^(.*) v(\d+)$")
+# Single translate table replaces bad chars in one C-level pass, same
+# scheme as the other scripts.
+_SANITIZE_TABLE = str.maketrans({**{c: "_" for c in '<>:"/\\|?*'}, **{i: "_" for i in range(0x20)}})
 UNTITLED_PREFIX = "Untitled"
 LIKED_PREFIX = "(Liked) "
 
+# C-implemented sort key; a lambda with two subscripts runs per element.
+_clip_sort_key = itemgetter("created_at", "id")
+
 
 def sanitize_filename(name, maxlen=200):
-    safe = re.sub(FILENAME_BAD_CHARS, "_", name)
-    safe = safe.strip(" .")
-    return safe[:maxlen] if len(safe) > maxlen else safe
+    # str slicing returns the string itself when already short enough, so no
+    # length branch is needed.
+    return name.translate(_SANITIZE_TABLE).strip(" .")[:maxlen]
 
 
 def clip_is_liked(clip):
@@ -66,61 +77,175 @@ def display_title(clip):
 
 def load_state(path):
     if not path.exists():
-        return {"failed_attempts": {}}
+        return {"failed_attempts": {}, "downloaded_urls": {}}
     try:
-        data = json.loads(path.read_text())
+        data = orjson.loads(path.read_bytes())
         if not isinstance(data, dict):
             raise ValueError("state must be an object")
         failed_attempts = data.get("failed_attempts", {})
         if not isinstance(failed_attempts, dict):
             failed_attempts = {}
+        downloaded_urls = data.get("downloaded_urls", {})
+        if not isinstance(downloaded_urls, dict):
+            downloaded_urls = {}
         return {
             "failed_attempts": {str(k): int(v) for k, v in failed_attempts.items() if isinstance(v, int)},
+            "downloaded_urls": {
+                str(u): rec
+                for u, rec in downloaded_urls.items()
+                if isinstance(rec, dict) and isinstance(rec.get("path"), str) and isinstance(rec.get("xxh128"), str)
+            },
         }
     except Exception:
-        return {"failed_attempts": {}}
+        return {"failed_attempts": {}, "downloaded_urls": {}}
 
 
-def save_state(path, failed_attempts):
+def save_state(path, failed_attempts, downloaded_urls):
     payload = {
         "updated_at": utc_ts(),
         "failed_attempts": failed_attempts,
+        "downloaded_urls": downloaded_urls,
     }
-    path.write_text(json.dumps(payload, indent=2))
-
-
-def reserve_unique_path(out_dir, base_name):
-    first = out_dir / f"{base_name}.mp3"
-    if not first.exists():
-        return first
-    n = 2
+    # Write-then-rename so a crash mid-save never leaves a torn state file.
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+    os.replace(tmp_path, path)
+
+
+def reserve_unique_path(out_dir, base_name, max_ver):
+    # max_ver remembers the highest version already used per base, so the
+    # next free name is computed directly instead of probing `.mp3`, ` v2`,
+    # ` v3`, ... in order. The version is claimed before the exists() check,
+    # so concurrent reservations for the same base get distinct names; the
+    # check only guards against files that appeared behind the watcher's back.
+    n = max_ver.get(base_name, 0) + 1
     while True:
-        candidate = out_dir / f"{base_name} v{n}.mp3"
+        max_ver[base_name] = n
+        candidate = out_dir / (f"{base_name}.mp3" if n == 1 else f"{base_name} v{n}.mp3")
         if not candidate.exists():
             return candidate
         n += 1
 
 
+def _split_base(stem):
+    # Strip a literal ' v<digits>' suffix without entering the regex engine;
+    # the overwhelmingly common case is an unversioned name.
+    head, sep, tail = stem.rpartition(" v")
+    if sep and tail.isdigit():
+        return head, int(tail)
+    return stem, 1
+
+
 def count_local_mp3_by_base(out_dir):
     counts = Counter()
-    for path in out_dir.glob("*.mp3"):
-        stem = path.stem
-        m = VERSIONED_NAME_RE.match(stem)
-        base = m.group(1) if m else stem
-        counts[base] += 1
-    return counts
+    max_ver = {}
+    # os.scandir works from d_name alone: no Path allocation, no per-entry stat.
+    with os.scandir(out_dir) as entries:
+        for entry in entries:
+            name = entry.name
+            if not name.endswith(".mp3"):
+                continue
+            base, ver = _split_base(name[:-4])
+            counts[base] += 1
+            if ver > max_ver.get(base, 0):
+                max_ver[base] = ver
+    return counts, max_ver
+
+
+# Clip metadata is immutable, so derived names are cached by clip id across
+# cycles; the oldest entries are dropped past the cap.
+_NAME_CACHE = {}
+_NAME_CACHE_MAX = 200_000
+
+# A 64 KiB prefix hash is enough to recognise an already-downloaded copy of
+# the same encoded audio without re-reading whole files; xxh128 is far
+# cheaper than a cryptographic hash and collision-safe at this scale.
+DEDUP_PROBE_BYTES = 64 * 1024
+
+
+def _first_chunk_digest(path):
+    with open(path, "rb") as f:
+        return xxhash.xxh128(f.read(DEDUP_PROBE_BYTES)).hexdigest()
+
+
+def _clone_known_file(existing, digest, target):
+    # Runs in the executor: blocking stat/hash/link work stays off the loop.
+    try:
+        if _first_chunk_digest(existing) != digest:
+            return False
+        try:
+            os.link(existing, target)
+        except OSError:
+            shutil.copyfile(existing, target)
+        if os.path.getsize(target) == os.path.getsize(existing):
+            return True
+        os.unlink(target)
+        return False
+    except OSError:
+        return False
+
+
+# After this many downloads fail in a row within one cycle, the remaining
+# planned downloads are skipped: the API or network is almost certainly down
+# and each further attempt would burn its full retry/backoff budget.
+CONSECUTIVE_FAILURE_LIMIT = 5
+
+
+# Parsed-cache memo: the watcher polls every few seconds but the cache files
+# only change when progress_check appends a page, so reuse the parsed result
+# while the (mtime_ns, size) signature of the sources is unchanged.
+_LOAD_CACHE = {"sig": None, "result": None}
+
+
+def _cache_signature(cache_dir):
+    sig = []
+    for path in [cache_dir / "head.json", cache_dir / "cache.ndjson"] + sorted(cache_dir.glob("page_*.json")):
+        try:
+            st = path.stat()
+            sig.append((path.name, st.st_mtime_ns, st.st_size))
+        except OSError:
+            continue
+    return tuple(sig)
 
 
 def load_cache_clips(cache_dir):
+    sig = _cache_signature(cache_dir)
+    if sig and sig == _LOAD_CACHE["sig"]:
+        return _LOAD_CACHE["result"]
+
     expected = Counter()
-    clips_by_base = defaultdict(list)
+    clips_by_base = {}
     seen_ids = set()
     parsed_pages = 0
     unreadable_pages = 0
 
-    for page_path in sorted(cache_dir.glob("page_*.json")):
+    # progress_check prepends fresh clips to head.json and stores pages as
+    # ndjson lines in cache.ndjson; older caches still have page_*.json files.
+    raw_pages = []
+    head_path = cache_dir / "head.json"
+    if head_path.exists():
+        raw_pages.append(head_path.read_bytes())
+    ndjson_path = cache_dir / "cache.ndjson"
+    if ndjson_path.exists():
+        raw_pages.extend(ndjson_path.read_bytes().splitlines())
+    else:
+        for page_path in sorted(cache_dir.glob("page_*.json")):
+            raw_pages.append(page_path.read_bytes())
+
+    # Local binds for the hot loop; the cache can hold tens of thousands of
+    # clips and this runs once per watcher cycle after a cache change.
+    _seen = seen_ids
+    _seen_add = seen_ids.add
+    _expected = expected
+    _by_base = clips_by_base
+    _name_cache = _NAME_CACHE
+    _name_cache_get = _NAME_CACHE.get
+
+    for raw in raw_pages:
+        if not raw.strip():
+            continue
         try:
-            data = json.loads(page_path.read_text())
+            data = orjson.loads(raw)
         except Exception:
             unreadable_pages += 1
             continue
@@ -135,15 +260,24 @@ def load_cache_clips(cache_dir):
             audio_url = clip.get("audio_url")
             if not clip_id or not audio_url:
                 continue
-            if clip_id in seen_ids:
+            n_before = len(_seen)
+            _seen_add(clip_id)
+            if len(_seen) == n_before:
                 continue
-            seen_ids.add(clip_id)
 
-            title = display_title(clip)
-            base = clip_base_name(clip)
-
-            expected[base] += 1
-            clips_by_base[base].append(
+            names = _name_cache_get(clip_id)
+            if names is None:
+                if len(_name_cache) >= _NAME_CACHE_MAX:
+                    _name_cache.pop(next(iter(_name_cache)))
+                names = (display_title(clip), clip_base_name(clip))
+                _name_cache[clip_id] = names
+            title, base = names
+
+            _expected[base] += 1
+            bucket = _by_base.get(base)
+            if bucket is None:
+                bucket = _by_base[base] = []
+            bucket.append(
                 {
                     "id": clip_id,
                     "title": title,
@@ -153,10 +287,13 @@ def load_cache_clips(cache_dir):
                 }
             )
 
-    for base in clips_by_base:
-        clips_by_base[base].sort(key=lambda c: (c["created_at"], c["id"]))
+    for bucket in clips_by_base.values():
+        bucket.sort(key=_clip_sort_key)
 
-    return expected, clips_by_base, parsed_pages, unreadable_pages
+    result = (expected, clips_by_base, parsed_pages, unreadable_pages)
+    _LOAD_CACHE["sig"] = sig
+    _LOAD_CACHE["result"] = result
+    return result
 
 
 def load_missing_hints(missing_file):
@@ -176,7 +313,7 @@ def progress_fetch_complete(summary_path):
     if not summary_path.exists():
         return False
     try:
-        data = json.loads(summary_path.read_text())
+        data = orjson.loads(summary_path.read_bytes())
     except Exception:
         return False
     return bool(data.get("complete_api_fetch"))
@@ -184,63 +321,90 @@ def progress_fetch_complete(summary_path):
 
 def build_plan(missing_counts, clips_by_base, failed_attempts, hinted_bases, max_downloads, per_clip_max_failures):
     plan = []
-    hinted_set = set(hinted_bases)
-
-    def sort_key(base_name):
-        return (0 if base_name in hinted_set else 1, base_name)
-
-    for base in sorted(missing_counts.keys(), key=sort_key):
+    hinted_set = frozenset(hinted_bases)
+    dead_ids = {cid for cid, n in failed_attempts.items() if n >= per_clip_max_failures}
+
+    # Pop bases in priority order until the plan fills. heapify is O(n) and
+    # only as many pops as needed happen, so a full sort is still avoided,
+    # while bases whose clips are all dead no longer use up plan slots the
+    # way a fixed nsmallest cut let them.
+    heap = [(0 if base in hinted_set else 1, base) for base in missing_counts]
+    heapq.heapify(heap)
+    while heap and len(plan) < max_downloads:
+        _, base = heapq.heappop(heap)
         need = missing_counts[base]
         if need <= 0:
             continue
         for clip in clips_by_base.get(base, []):
-            clip_id = clip["id"]
-            if failed_attempts.get(clip_id, 0) >= per_clip_max_failures:
+            if clip["id"] in dead_ids:
                 continue
             plan.append(clip)
             need -= 1
             if need <= 0 or len(plan) >= max_downloads:
                 break
-        if len(plan) >= max_downloads:
-            break
     return plan
 
 
-def download_clip(session, clip, out_dir, token, timeout, max_retries, max_backoff, jitter, base_sleep, log):
+async def download_clip(session, clip, out_dir, max_ver, downloaded_urls, token, timeout, max_retries, max_backoff, jitter, base_sleep, chunk_size, log):
     headers = {"Authorization": f"Bearer {token}"}
     clip_id = clip["id"]
     url = clip["audio_url"]
     base_name = clip["base"]
+    # Per-operation timeouts mirror the old requests behaviour; a total
+    # timeout would cut off large but healthy downloads.
+    client_timeout = aiohttp.ClientTimeout(sock_connect=timeout, sock_read=timeout)
+
+    # The feed sometimes lists the same audio_url under more than one clip;
+    # if we already hold a verified copy, link it instead of re-fetching.
+    known = downloaded_urls.get(url)
+    if known is not None:
+        out_path = reserve_unique_path(out_dir, base_name, max_ver)
+        loop = asyncio.get_running_loop()
+        cloned = await loop.run_in_executor(
+            None, _clone_known_file, known["path"], known["xxh128"], out_path
+        )
+        if cloned:
+            log(f"Linked clip {clip_id} from existing copy {known['path']} (same audio_url).")
+            return {"ok": True, "path": str(out_path), "clip_id": clip_id, "deduped": True}
 
     attempt = 0
     while True:
         attempt += 1
         try:
-            with session.get(url, headers=headers, stream=True, timeout=timeout) as r:
-                if r.status_code in (401, 403):
-                    return {"ok": False, "retryable": False, "error": f"auth_failed:{r.status_code}"}
-                if r.status_code == 429 or 500 <= r.status_code < 600:
-                    raise requests.HTTPError(f"retryable status {r.status_code}")
-                if 400 <= r.status_code < 500:
-                    return {"ok": False, "retryable": False, "error": f"http_{r.status_code}"}
+            async with session.get(url, headers=headers, timeout=client_timeout) as r:
+                if r.status in (401, 403):
+                    return {"ok": False, "retryable": False, "error": f"auth_failed:{r.status}"}
+                if r.status == 429 or 500 <= r.status < 600:
+                    raise aiohttp.ClientError(f"retryable status {r.status}")
+                if 400 <= r.status < 500:
+                    return {"ok": False, "retryable": False, "error": f"http_{r.status}"}
                 r.raise_for_status()
 
-                out_path = reserve_unique_path(out_dir, base_name)
-                with out_path.open("xb") as f:
-                    for chunk in r.iter_content(chunk_size=8192):
-                        if chunk:
-                            f.write(chunk)
-
+                out_path = reserve_unique_path(out_dir, base_name, max_ver)
+                # Disk writes go through the default executor so a slow write
+                # never stalls the event loop and the other transfers on it.
+                loop = asyncio.get_running_loop()
+                # buffering=0: chunks are already write-sized batches, so the
+                # buffered IO layer would only add a second copy.
+                f = await loop.run_in_executor(None, out_path.open, "xb", 0)
+                try:
+                    async for chunk in r.content.iter_chunked(chunk_size):
+                        await loop.run_in_executor(None, f.write, chunk)
+                finally:
+                    await loop.run_in_executor(None, f.close)
+
+                digest = await loop.run_in_executor(None, _first_chunk_digest, out_path)
+                downloaded_urls[url] = {"path": str(out_path), "xxh128": digest}
                 return {"ok": True, "path": str(out_path), "clip_id": clip_id}
-        except (requests.RequestException, OSError) as e:
+        except (aiohttp.ClientError, asyncio.TimeoutError, OSError) as e:
             if max_retries and attempt >= max_retries:
                 return {"ok": False, "retryable": True, "error": str(e)}
             if attempt == 1 and is_dns_error(e):
                 log("WARN: DNS resolution failed during targeted download; check network/VPN/DNS.")
-            backoff = min(max_backoff, (2 ** (attempt - 1)) * base_sleep)
+            backoff = min(max_backoff, base_sleep * (1 << (attempt - 1)))
             backoff += random.uniform(0, jitter)
             log(f"Retrying clip {clip_id} in {backoff:.1f}s (attempt {attempt}): {e}")
-            time.sleep(backoff)
+            await asyncio.sleep(backoff)
 
 
 def resolve_cycle_download_limit(max_downloads, missing_files):
@@ -264,6 +428,7 @@ def main():
     parser.add_argument("--log-file", type=str, default=None, help="Log file path.")
     parser.add_argument("--poll-interval", type=float, default=5.0, help="Seconds between scan cycles.")
     parser.add_argument("--timeout", type=float, default=30.0, help="HTTP timeout in seconds.")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent clip downloads per cycle.")
     parser.add_argument(
         "--max-downloads",
         type=int,
@@ -271,10 +436,28 @@ def main():
         help="Max downloads per cycle (0 = all currently-missing files).",
     )
     parser.add_argument("--download-sleep", type=float, default=0.2, help="Base sleep for retry backoff.")
+    parser.add_argument(
+        "--min-interval",
+        type=float,
+        default=0.0,
+        help="Minimum pause per download slot in seconds (0 = no pacing).",
+    )
+    parser.add_argument(
+        "--download-chunk-size",
+        type=int,
+        default=65536,
+        help="Streaming chunk size in bytes for clip downloads.",
+    )
     parser.add_argument("--max-retries", type=int, default=8, help="Max retries per clip download (0 = infinite).")
     parser.add_argument("--max-backoff", type=float, default=60.0, help="Maximum retry backoff in seconds.")
     parser.add_argument("--jitter", type=float, default=0.3, help="Random jitter added to backoff sleep.")
     parser.add_argument("--max-idle-cycles", type=int, default=0, help="Stop after N idle cycles (0 = infinite).")
+    parser.add_argument(
+        "--resync-interval",
+        type=int,
+        default=20,
+        help="Full out-dir rescan every N cycles; between rescans counts track downloads in memory.",
+    )
     parser.add_argument(
         "--once",
         action="store_true",
@@ -298,11 +481,16 @@ def main():
     progress_missing_path = out_dir / "progress_missing.txt"
     progress_summary_path = out_dir / "progress_summary.json"
 
-    def log(msg):
-        line = f"[{utc_ts()}] {msg}"
-        with log_path.open("a", encoding="utf-8") as f:
-            f.write(line + "\n")
-        print(line)
+    # One logger with a persistent file handle instead of reopening the log
+    # file for every line; format matches the old hand-rolled prefix.
+    logger = logging.getLogger("targeted_update")
+    logger.setLevel(logging.INFO)
+    formatter = logging.Formatter("[%(asctime)s UTC] %(message)s", datefmt="%Y-%m-%d %H:%M:%S")
+    formatter.converter = time.gmtime
+    for handler in (logging.FileHandler(log_path, encoding="utf-8"), logging.StreamHandler(sys.stdout)):
+        handler.setFormatter(formatter)
+        logger.addHandler(handler)
+    log = logger.info
 
     token = args.token
     if not token:
@@ -314,103 +502,174 @@ def main():
 
     state = load_state(state_path)
     failed_attempts = state.get("failed_attempts", {})
-
-    session = requests.Session()
-    idle_cycles = 0
-    cycle = 0
+    downloaded_urls = state.get("downloaded_urls", {})
 
     log("Starting targeted update watcher...")
 
-    while True:
-        cycle += 1
-        expected, clips_by_base, parsed_pages, unreadable_pages = load_cache_clips(cache_dir)
-        actual = count_local_mp3_by_base(out_dir)
-        hinted_bases = load_missing_hints(progress_missing_path)
-
-        missing = {base: (need - actual.get(base, 0)) for base, need in expected.items() if need > actual.get(base, 0)}
-        missing_titles = len(missing)
-        missing_files = sum(missing.values())
-
-        log(
-            f"Cycle {cycle}: cache_pages={parsed_pages} unreadable_pages={unreadable_pages} "
-            f"expected_files={sum(expected.values())} local_files={sum(actual.values())} "
-            f"missing_titles={missing_titles} missing_files={missing_files}"
-        )
+    asyncio.run(run_watcher(args, out_dir, cache_dir, state_path, progress_missing_path,
+                            progress_summary_path, token, failed_attempts, downloaded_urls, log))
 
-        cycle_max_downloads = resolve_cycle_download_limit(args.max_downloads, missing_files)
 
-        plan = build_plan(
-            missing_counts=missing,
-            clips_by_base=clips_by_base,
-            failed_attempts=failed_attempts,
-            hinted_bases=hinted_bases,
-            max_downloads=cycle_max_downloads,
-            per_clip_max_failures=max(args.max_retries, 1) if args.max_retries else 9999999,
-        )
+async def run_watcher(args, out_dir, cache_dir, state_path, progress_missing_path,
+                      progress_summary_path, token, failed_attempts, downloaded_urls, log):
+    idle_cycles = 0
+    cycle = 0
+    actual = None
+    last_resync_cycle = 0
+    state_dirty = False
+
+    # One session for the watcher lifetime so the connector pool (and its
+    # warm TLS connections to the CDN) is reused across cycles.
+    connector = aiohttp.TCPConnector(
+        limit=args.concurrency, limit_per_host=args.concurrency, keepalive_timeout=75
+    )
+    # identity avoids the server gzip-wrapping already-compressed MP3 bodies,
+    # which would force a decompress-and-rebuffer pass on every chunk.
+    session_headers = {"Accept-Encoding": "identity", "Connection": "keep-alive"}
+    async with aiohttp.ClientSession(connector=connector, headers=session_headers) as session:
+        while True:
+            cycle += 1
+            expected, clips_by_base, parsed_pages, unreadable_pages = load_cache_clips(cache_dir)
+            # Rescanning the out dir every cycle re-reads thousands of entries
+            # to learn what we already know; between periodic resyncs the
+            # counter tracks our own successful downloads. Drain mode always
+            # rescans so its remaining count is authoritative.
+            if actual is None or args.once or cycle - last_resync_cycle >= args.resync_interval:
+                actual, max_ver = count_local_mp3_by_base(out_dir)
+                last_resync_cycle = cycle
+            missing = {base: (need - actual.get(base, 0)) for base, need in expected.items() if need > actual.get(base, 0)}
+            missing_titles = len(missing)
+            missing_files = sum(missing.values())
+
+            log(
+                f"Cycle {cycle}: cache_pages={parsed_pages} unreadable_pages={unreadable_pages} "
+                f"expected_files={sum(expected.values())} local_files={sum(actual.values())} "
+                f"missing_titles={missing_titles} missing_files={missing_files}"
+            )
 
-        downloaded_this_cycle = 0
-        if not plan:
-            log("No eligible clip downloads in this cycle.")
-        else:
-            log(f"Planned clip downloads this cycle: {len(plan)}")
-            for clip in plan:
-                clip_id = clip["id"]
-                if args.dry_run:
-                    log(f"DRY RUN: would download clip {clip_id} title={clip['title']!r}")
-                    continue
-                result = download_clip(
-                    session=session,
-                    clip=clip,
-                    out_dir=out_dir,
-                    token=token,
-                    timeout=args.timeout,
-                    max_retries=args.max_retries,
-                    max_backoff=args.max_backoff,
-                    jitter=args.jitter,
-                    base_sleep=args.download_sleep,
-                    log=log,
-                )
-                if result.get("ok"):
-                    failed_attempts.pop(clip_id, None)
-                    downloaded_this_cycle += 1
-                    log(f"Downloaded clip {clip_id} -> {result['path']}")
-                else:
-                    failed_attempts[clip_id] = int(failed_attempts.get(clip_id, 0)) + 1
-                    log(f"Failed clip {clip_id}: {result.get('error')}")
-                time.sleep(0.05)
-
-        save_state(state_path, failed_attempts)
-
-        if downloaded_this_cycle == 0:
-            idle_cycles += 1
-        else:
-            idle_cycles = 0
-
-        expected_after, _, _, _ = load_cache_clips(cache_dir)
-        actual_after = count_local_mp3_by_base(out_dir)
-        remaining_missing = sum(
-            need - actual_after.get(base, 0) for base, need in expected_after.items() if need > actual_after.get(base, 0)
-        )
+            cycle_max_downloads = resolve_cycle_download_limit(args.max_downloads, missing_files)
+
+            # Hints only decide which missing bases go first; when the whole
+            # backlog fits in one cycle anyway, ordering is moot and the hints
+            # file need not be read at all.
+            if cycle_max_downloads >= missing_files:
+                hinted_bases = []
+            else:
+                hinted_bases = load_missing_hints(progress_missing_path)
+
+            plan = build_plan(
+                missing_counts=missing,
+                clips_by_base=clips_by_base,
+                failed_attempts=failed_attempts,
+                hinted_bases=hinted_bases,
+                max_downloads=cycle_max_downloads,
+                per_clip_max_failures=max(args.max_retries, 1) if args.max_retries else 9999999,
+            )
 
-        if args.once:
-            if remaining_missing == 0:
-                log("Exiting after drain run (--once): no missing files remain.")
-                break
+            downloaded_this_cycle = 0
             if not plan:
-                log("Exiting after drain run (--once): no eligible clips remain to satisfy missing files.")
-                break
-            log(f"Drain run (--once) continuing: remaining_missing_files={remaining_missing}")
-            continue
+                log("No eligible clip downloads in this cycle.")
+            elif args.dry_run:
+                log(f"Planned clip downloads this cycle: {len(plan)}")
+                for clip in plan:
+                    log(f"DRY RUN: would download clip {clip['id']} title={clip['title']!r}")
+            else:
+                log(f"Planned clip downloads this cycle: {len(plan)}")
+                sem = asyncio.Semaphore(args.concurrency)
+                # Downloads finish out of order under gather, so "consecutive"
+                # means consecutive in completion order; any success resets it.
+                breaker = {"failures": 0}
+
+                async def bounded_download(clip):
+                    async with sem:
+                        if breaker["failures"] >= CONSECUTIVE_FAILURE_LIMIT:
+                            return clip, {"ok": False, "skipped": True, "error": "circuit_open"}
+                        result = await download_clip(
+                            session=session,
+                            clip=clip,
+                            out_dir=out_dir,
+                            max_ver=max_ver,
+                            downloaded_urls=downloaded_urls,
+                            token=token,
+                            timeout=args.timeout,
+                            max_retries=args.max_retries,
+                            max_backoff=args.max_backoff,
+                            jitter=args.jitter,
+                            base_sleep=args.download_sleep,
+                            chunk_size=args.download_chunk_size,
+                            log=log,
+                        )
+                        if result.get("ok"):
+                            breaker["failures"] = 0
+                        else:
+                            breaker["failures"] += 1
+                        if args.min_interval > 0:
+                            await asyncio.sleep(args.min_interval)
+                        return clip, result
+
+                skipped_this_cycle = 0
+                for clip, result in await asyncio.gather(*(bounded_download(c) for c in plan)):
+                    clip_id = clip["id"]
+                    if result.get("skipped"):
+                        skipped_this_cycle += 1
+                        continue
+                    if result.get("ok"):
+                        if failed_attempts.pop(clip_id, None) is not None:
+                            state_dirty = True
+                        if not result.get("deduped"):
+                            # A fresh download added its url to downloaded_urls.
+                            state_dirty = True
+                        downloaded_this_cycle += 1
+                        actual[clip["base"]] += 1
+                        log(f"Downloaded clip {clip_id} -> {result['path']}")
+                    else:
+                        failed_attempts[clip_id] = int(failed_attempts.get(clip_id, 0)) + 1
+                        state_dirty = True
+                        log(f"Failed clip {clip_id}: {result.get('error')}")
+                if skipped_this_cycle:
+                    log(
+                        f"Circuit breaker tripped after {CONSECUTIVE_FAILURE_LIMIT} consecutive failures; "
+                        f"skipped {skipped_this_cycle} planned downloads this cycle."
+                    )
+
+            if state_dirty:
+                save_state(state_path, failed_attempts, downloaded_urls)
+                state_dirty = False
+
+            if downloaded_this_cycle == 0:
+                idle_cycles += 1
+            else:
+                idle_cycles = 0
+
+            # expected didn't change during the cycle and successful downloads
+            # are counted in-process, so no second cache parse or dir scan is
+            # needed. Staleness can only delay --stop-when-clean by one cycle.
+            remaining_missing = missing_files - downloaded_this_cycle
+
+            if args.once:
+                if args.dry_run:
+                    # A dry run never makes progress, so draining would spin
+                    # on the same plan forever; one planning pass is the point.
+                    log("Exiting after dry-run planning pass (--once --dry-run).")
+                    break
+                if remaining_missing == 0:
+                    log("Exiting after drain run (--once): no missing files remain.")
+                    break
+                if not plan:
+                    log("Exiting after drain run (--once): no eligible clips remain to satisfy missing files.")
+                    break
+                log(f"Drain run (--once) continuing: remaining_missing_files={remaining_missing}")
+                continue
 
-        if args.stop_when_clean and remaining_missing == 0 and progress_fetch_complete(progress_summary_path):
-            log("No missing files and progress_check reports complete fetch. Exiting.")
-            break
+            if args.stop_when_clean and remaining_missing == 0 and progress_fetch_complete(progress_summary_path):
+                log("No missing files and progress_check reports complete fetch. Exiting.")
+                break
 
-        if args.max_idle_cycles and idle_cycles >= args.max_idle_cycles:
-            log(f"Reached max idle cycles: {args.max_idle_cycles}. Exiting.")
-            break
+            if args.max_idle_cycles and idle_cycles >= args.max_idle_cycles:
+                log(f"Reached max idle cycles: {args.max_idle_cycles}. Exiting.")
+                break
 
-        time.sleep(args.poll_interval)
+            await asyncio.sleep(args.poll_interval)
 
 
 if __name__ == "__main__":